@@ -54,6 +54,29 @@ def clean_hidden_directories(directory):
                 os.remove(path)
 
 
+def write_grading_manifest(DIRECTORY):
+    '''precompute the parsed rubric, directories, comments and tag code read by `hidden_tests.py` into `hidden/grading_manifest.json`'''
+    try:
+        command = "\"%s\" -c \"import hidden.hidden_tests as hidn; hidn.write_grading_manifest()\"" % (sys.executable)
+        process = subprocess.run(command, shell=True, cwd=DIRECTORY, capture_output=True)
+        print(process.stderr.decode("utf-8"))
+    except Exception as e:
+        print(e)
+
+
+def check_staff_nb(FILE, DIRECTORY):
+    '''make sure that the static analysis of `hidden_tests.py` does not find any function of a "function is not used
+    to answer" rubric item unused in the staff notebook `FILE`'''
+    command = "\"%s\" -c \"import json, hidden.hidden_tests as hidn; print(json.dumps(hidn.check_staff_nb('%s')))\"" % (sys.executable, os.path.basename(FILE))
+    process = subprocess.run(command, shell=True, cwd=DIRECTORY, capture_output=True)
+    print(process.stderr.decode("utf-8"))
+    if process.returncode != 0:
+        raise Exception("could not check the staff notebook `%s` with `hidden_tests.py`" % (os.path.basename(FILE)))
+    deductions = json.loads(process.stdout.decode("utf-8").strip().split("\n")[-1])
+    if deductions != []:
+        raise Exception("functions found unused in the staff notebook by the static analysis: %s" % (", ".join(deductions)))
+
+
 submission_instructions = """## Submission
 It is recommended that at this stage, you Restart and Run all Cells in your notebook.
 That will automatically save your work and generate a zip file for you to submit.
@@ -333,6 +356,8 @@ def build_project(FILE, DIRECTORY, destination="project"):
     if os.path.exists(os.path.join(DIRECTORY, "sandbox", "autograder", "hidden")):
         shutil.copytree(os.path.join(DIRECTORY, "sandbox", "autograder", "hidden"), os.path.join(DIRECTORY, "hidden"))
         clean_hidden_directories(os.path.join(DIRECTORY, "hidden"))
+        write_grading_manifest(DIRECTORY)
+        check_staff_nb(FILE, DIRECTORY)
     
     run_otter_tests(FILE, DIRECTORY, destination)
     if os.path.exists(os.path.join(DIRECTORY, "hidden")):
@@ -4,6 +4,7 @@ import os, json, math, copy
 from collections import namedtuple
 import pandas as pd
 import bs4
+import nbformat
 from numpy import nan
 
 HIDDEN_FILE = os.path.join("hidden", "hidden_tests.py")
@@ -19,6 +20,8 @@ PLOT_FILE = 'expected_plots.json'
 
 PASS = "All test cases passed!"
 
+_notebooks = {}  # notebooks already read by `read_nb`
+
 TEXT_FORMAT = "TEXT_FORMAT"  # question type when expected answer is a type, str, int, float, or bool
 TEXT_FORMAT_UNORDERED_LIST = "TEXT_FORMAT_UNORDERED_LIST"  # question type when the expected answer is a list or a set where the order does *not* matter
 TEXT_FORMAT_ORDERED_LIST = "TEXT_FORMAT_ORDERED_LIST"  # question type when the expected answer is a list or tuple where the order does matter
@@ -834,7 +837,17 @@ def identify_nb():
 
 
 
-import nbformat
+def read_nb(file):
+    """read_nb(file) reads the notebook `file` once and keeps it in memory until the file changes; on the Gradescope
+    autograder, the notebook already read by the hidden test file is reused instead"""
+    if os.path.exists(HIDDEN_FILE) and os.path.abspath(file) == os.path.abspath(os.path.join(hidn.DIRECTORY, hidn.FILE)):
+        return hidn.get_submission_nb(cleaned=False)
+    stat = os.stat(file)
+    key = (os.path.abspath(file), stat.st_size, stat.st_mtime_ns)
+    if key not in _notebooks:
+        with open(file, encoding='utf-8') as f:
+            _notebooks[key] = nbformat.read(f, as_version=nbformat.NO_CONVERT)
+    return _notebooks[key]
 
 def get_score_digit(digit):
     """get_score_digit(digit) returns the `digit` of the score using the hidden test file on the Gradescope autograder"""
@@ -842,8 +855,7 @@ def get_score_digit(digit):
         file = identify_nb()
         if file == None:
             return 0
-        with open(file, encoding='utf-8') as f:
-            nb = nbformat.read(f, as_version=nbformat.NO_CONVERT)
+        nb = read_nb(file)
         if nb['cells'][0]['cell_type'] == "raw" and nb['cells'][0]['source'].startswith("# ASSIGNMENT CONFIG"):
             return 1
         elif not os.path.exists(HIDDEN_FILE):
@@ -863,8 +875,7 @@ def detect_public_tests():
     other than the `import public_tests`'''
     try:
         file = identify_nb()
-        with open(file, encoding='utf-8') as f:
-            nb = nbformat.read(f, as_version=nbformat.NO_CONVERT)
+        nb = read_nb(file)
         if nb['cells'][0]['cell_type'] == "raw" and nb['cells'][0]['source'].startswith("# ASSIGNMENT CONFIG"):
             return
         if hidn.detect_public_tests():